@@ -1,30 +1,49 @@
-import io
 import logging
-from datetime import datetime
+import time
+from typing import AsyncIterator
+import pandas as pd
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from app.domain.dtos.prediction import PredictionResponseDTO, SinglePredictionDTO
 from app.services import PredictionError, PredictionService, get_prediction_service
 
 router = APIRouter(prefix="/predictions")
 LOGGER = logging.getLogger(__name__)
 
+CSV_CHUNK_ROWS = 4096
+CONTENT_DISPOSITION = 'attachment; filename="predictions_{}.csv"'
+
+
+async def _iter_csv(dataframe: pd.DataFrame) -> AsyncIterator[bytes]:
+    """Yield the scored dataframe as CSV bytes, one chunk of rows at a time."""
+
+    yield dataframe.iloc[:0].to_csv(index=False).encode("utf-8")
+    for start in range(0, len(dataframe), CSV_CHUNK_ROWS):
+        chunk = dataframe.iloc[start : start + CSV_CHUNK_ROWS]
+        yield chunk.to_csv(index=False, header=False).encode("utf-8")
+
 
 @router.post(
     "",
-    response_model=PredictionResponseDTO,
+    response_class=ORJSONResponse,
+    responses={status.HTTP_200_OK: {"model": PredictionResponseDTO}},
     status_code=status.HTTP_200_OK,
     summary="Score a single applicant",
 )
 async def predict_single(
     payload: SinglePredictionDTO,
     service: PredictionService = Depends(get_prediction_service),
-) -> PredictionResponseDTO:
-    """Return default probability for a single payload."""
+) -> ORJSONResponse:
+    """Return default probability for a single payload.
+
+    The service builds the response fields itself, so the dict is serialized
+    directly instead of being revalidated through PredictionResponseDTO, which
+    only documents the schema.
+    """
 
     try:
-        result = await service.predict_single(payload.model_dump())
-        return PredictionResponseDTO(**result)
+        result = await service.predict_single_model(payload)
+        return ORJSONResponse(result)
     except PredictionError as exc:
         LOGGER.warning("Single prediction rejected: %s", exc)
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
@@ -49,13 +68,9 @@ async def predict_batch(
         content = await file.read()
         dataframe = await service.predict_batch(content, file.filename or "batch.csv")
 
-        buffer = io.StringIO()
-        dataframe.to_csv(buffer, index=False)
-        buffer.seek(0)
-        timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
-        filename = f"predictions_{timestamp}.csv"
-        headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
-        return StreamingResponse(buffer, media_type="text/csv", headers=headers)
+        timestamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+        headers = {"Content-Disposition": CONTENT_DISPOSITION.format(timestamp)}
+        return StreamingResponse(_iter_csv(dataframe), media_type="text/csv", headers=headers)
     
     except PredictionError as exc:
         LOGGER.warning("Batch prediction rejected: %s", exc)
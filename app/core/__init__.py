@@ -1,4 +1,5 @@
-from .config import settings
+from .config import get_settings, settings
 from .logging import setup_logging
+from .middleware import UploadSizeLimitMiddleware
 
-__all__ = ["settings", "setup_logging"]
+__all__ = ["UploadSizeLimitMiddleware", "get_settings", "settings", "setup_logging"]
@@ -1,32 +1,67 @@
-import os
+from functools import lru_cache
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import Field
+from pydantic_settings import BaseSettings
 
 
-class Settings(BaseModel):
-    """Application configuration container."""
+class Settings(BaseSettings):
+    """Application configuration container.
+
+    Each field is read from the environment variable of the same name in
+    upper case (e.g. ``MAX_BATCH_ROWS``).
+    """
 
     base_dir: Path = Field(
         default=Path(__file__).resolve().parents[2],
         description="Project root directory.",
     )
     api_title: str = Field(
-        default=os.getenv("API_TITLE", "Default Credit Risk API"),
+        default="Default Credit Risk API",
         description="FastAPI application title.",
     )
     api_version: str = Field(
-        default=os.getenv("API_VERSION", "0.1.0"),
+        default="0.1.0",
         description="FastAPI application version.",
     )
     log_level: str = Field(
-        default=os.getenv("LOG_LEVEL", "INFO"),
+        default="INFO",
         description="Root logging level.",
     )
     max_batch_rows: int = Field(
-        default=int(os.getenv("MAX_BATCH_ROWS", "60000")),
+        default=60000,
         description="Upper bound for accepted batch rows.",
     )
+    max_upload_bytes: int = Field(
+        default=50 * 1024 * 1024,
+        description="Upper bound for the batch upload request size in bytes.",
+    )
+    micro_batch_size: int = Field(
+        default=64,
+        description="Maximum single predictions coalesced into one model call.",
+    )
+    micro_batch_wait_ms: float = Field(
+        default=5.0,
+        description="Time window in milliseconds used to coalesce single predictions.",
+    )
+    prediction_cache_size: int = Field(
+        default=10000,
+        description="Maximum cached single predictions; 0 disables the cache.",
+    )
+    prediction_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds a cached single prediction stays valid.",
+    )
+    batch_parallel_workers: int = Field(
+        default=0,
+        description="Processes used to score large batches; 0 or 1 disables it.",
+    )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the application settings, reading the environment only once."""
 
+    return Settings()
 
-settings = Settings()
 
+settings = get_settings()
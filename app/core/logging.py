@@ -26,5 +26,7 @@ def setup_logging() -> None:
         },
     }
     dictConfig(config)
+    # Never let a failing log handler turn into a traceback dump of its own.
+    logging.raiseExceptions = False
     logging.getLogger(__name__).debug("Logging configured with level %s", settings.log_level)
 
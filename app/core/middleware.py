@@ -0,0 +1,40 @@
+import logging
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+from .config import settings
+
+LOGGER = logging.getLogger(__name__)
+
+
+class UploadSizeLimitMiddleware:
+    """Reject requests whose declared body exceeds the upload limit.
+
+    Runs before routing, so oversized multipart uploads are refused before
+    FastAPI reads and spools the body into an ``UploadFile``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the downstream ASGI application.
+
+        Args:
+            app: Application receiving requests within the limit.
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer 413 when Content-Length exceeds the configured limit."""
+
+        if scope["type"] == "http":
+            content_length = Headers(scope=scope).get("content-length", "")
+            if content_length.isdigit() and int(content_length) > settings.max_upload_bytes:
+                LOGGER.warning("Upload rejected: %s bytes", content_length)
+                response = ORJSONResponse(
+                    {"detail": f"Upload exceeds limit of {settings.max_upload_bytes} bytes."},
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
@@ -5,7 +5,7 @@ from pydantic import BaseModel, ConfigDict, Field
 class SinglePredictionDTO(BaseModel):
     """Data transfer object describing a single applicant."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     ID: Optional[int] = Field(default=1, description="Unique identifier for the applicant.")
     LIMIT_BAL: float = Field(..., description="Credit limit for the client.")
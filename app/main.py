@@ -1,7 +1,8 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.api import api_router
-from app.core import settings, setup_logging
+from app.core import UploadSizeLimitMiddleware, settings, setup_logging
 from app.services import get_prediction_service
 
 
@@ -10,16 +11,23 @@ async def lifespan(_: FastAPI):
     """Configure logging and warm up the prediction service."""
 
     setup_logging()
-    get_prediction_service()
-    yield
+    service = await get_prediction_service()
+    service.warm_up()
+    await service.start()
+    try:
+        yield
+    finally:
+        await service.stop()
 
 
 app = FastAPI(
     title=settings.api_title,
     version=settings.api_version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+app.add_middleware(UploadSizeLimitMiddleware)
 app.include_router(api_router)
 
 
@@ -1,9 +1,22 @@
 import asyncio
+import csv
 import io
 import logging
+import multiprocessing
+import secrets
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Awaitable, Dict, List, Tuple, TypeVar
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import xxhash
+from cachetools import TTLCache
+from pyarrow import csv as pa_csv
+from pydantic import BaseModel
 from app.core.config import settings
 from credit_default_model import (
     CreditDefaultModel,
@@ -13,6 +26,16 @@ from credit_default_model import (
 
 LOGGER = logging.getLogger(__name__)
 
+# Smallest slice worth shipping to a worker process; below this the pickling
+# round-trip outweighs the parallel speed-up.
+_MIN_PARALLEL_CHUNK_ROWS = 5000
+
+_CSV_BLOCK_SIZE = 1 << 20
+
+_WORKER_MODEL: CreditDefaultModel | None = None
+
+_T = TypeVar("_T")
+
 
 class PredictionError(Exception):
     """Domain exception raised on invalid prediction inputs."""
@@ -25,6 +48,22 @@ class PredictionService:
         """Instantiate the model wrapper."""
 
         self._model = CreditDefaultModel()
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._cache: TTLCache | None = None
+        if settings.prediction_cache_size > 0:
+            self._cache = TTLCache(
+                maxsize=settings.prediction_cache_size,
+                ttl=settings.prediction_cache_ttl,
+            )
+        # A per-process seed keeps cache-key collisions from being precomputed.
+        self._cache_seed = secrets.randbits(64)
+        # The identifier only labels the response, so payloads that differ by ID
+        # alone share a cache entry unless the model consumes it as a feature.
+        self._uncached_keys = {self._model.id_column}.difference(
+            self._model.expected_columns
+        )
         LOGGER.info(
             "PredictionService initialised using threshold %.4f", self.threshold
         )
@@ -35,6 +74,67 @@ class PredictionService:
 
         return self._model.threshold
 
+    def warm_up(self) -> None:
+        """Run a dummy prediction so the first request avoids cold-start costs."""
+
+        started = time.perf_counter()
+        self._model.warm_up()
+        LOGGER.info(
+            "Model warm-up completed in %.1f ms", (time.perf_counter() - started) * 1000
+        )
+
+    async def start(self) -> None:
+        """Start the micro-batching task and the optional batch process pool."""
+
+        if self._worker is not None:
+            return
+        if settings.batch_parallel_workers > 1:
+            self._executor = ProcessPoolExecutor(
+                max_workers=settings.batch_parallel_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_load_worker_model,
+            )
+            # Workers spawn lazily; start and warm all of them now so the first
+            # large batch does not pay for loading the model in each process.
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._executor, _worker_ready)
+                    for _ in range(settings.batch_parallel_workers)
+                )
+            )
+            LOGGER.info(
+                "Batch scoring parallelised across %d processes",
+                settings.batch_parallel_workers,
+            )
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run_micro_batches())
+        LOGGER.info(
+            "Micro-batching enabled with size %d and window %.1f ms",
+            settings.micro_batch_size,
+            settings.micro_batch_wait_ms,
+        )
+
+    async def stop(self) -> None:
+        """Stop the micro-batching task, its pending predictions, and the pool."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+        self._worker = None
+        self._queue = None
+
     async def predict_single(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Predict default probability for a single applicant.
 
@@ -48,24 +148,249 @@ class PredictionService:
             PredictionError: When the payload fails validation.
         """
 
-        frame = pd.DataFrame([payload])
+        key = self._cache_key(payload)
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                probability, is_default = cached
+                return self._build_result(
+                    {
+                        "id": payload[self._model.id_column],
+                        "probability": probability,
+                        "is_default": is_default,
+                    }
+                )
+
+        if self._queue is None:
+            scored = await self._score_records([payload], "single")
+            result = self._build_result(scored[0])
+        else:
+            result = await self._enqueue(payload)
+
+        if key is not None:
+            self._cache[key] = (result["probability"], result["is_default"])
+        return result
+
+    def _cache_key(self, payload: Dict[str, Any]) -> int | None:
+        """Return the cache key for a payload, or None when it must not be cached.
+
+        Payloads without an identifier bypass the cache so the model still
+        reports them as invalid, as do payloads orjson cannot serialize. Keys never leave the process, so a fast
+        seeded non-cryptographic hash is sufficient.
+        """
+
+        if self._cache is None or payload.get(self._model.id_column) is None:
+            return None
+        features = {
+            key: value for key, value in payload.items() if key not in self._uncached_keys
+        }
+        try:
+            serialized = orjson.dumps(features, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the model still scores these.
+            return None
+        return xxhash.xxh3_64_intdigest(serialized, seed=self._cache_seed)
+
+    async def predict_single_model(self, payload: BaseModel) -> Dict[str, Any]:
+        """Predict default probability from a validated request model.
+
+        Reads the field values straight from the model's attribute storage
+        instead of running them through ``model_dump`` serialization.
+
+        Args:
+            payload: Validated applicant data; must not be mutated while scoring.
+
+        Returns:
+            Dictionary containing probability, threshold, default flag, and id.
+
+        Raises:
+            PredictionError: When the payload fails validation.
+        """
+
+        return await self.predict_single(vars(payload))
+
+    async def _enqueue(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue a payload for the next micro-batch and await its result.
+
+        Structurally invalid payloads are rejected here so they never force the
+        worker to re-score a whole window row by row.
+        """
+
+        try:
+            self._model.validate_record(payload)
+        except ModelValidationError as exc:
+            raise PredictionError(str(exc)) from exc
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, future))
+        return await future
+
+    async def _run_micro_batches(self) -> None:
+        """Drain queued payloads into batches bounded by size and wait window."""
+
+        loop = asyncio.get_running_loop()
+        max_size = max(1, settings.micro_batch_size)
+        max_wait = settings.micro_batch_wait_ms / 1000
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + max_wait
+            while len(batch) < max_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._score_micro_batch(batch)
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+
+    async def _score_micro_batch(
+        self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]
+    ) -> None:
+        """Score queued payloads in one model call and resolve their futures.
+
+        Args:
+            batch: Pairs of payload and the future awaiting its result.
+        """
+
+        try:
+            scored = await self._score_records(
+                [payload for payload, _ in batch], "micro-batch"
+            )
+        except Exception as exc:
+            if len(batch) > 1:
+                # Payloads were pre-validated in _enqueue, so this only isolates
+                # rarer model-side failures instead of failing the whole window.
+                for item in batch:
+                    await self._score_micro_batch([item])
+                return
+            _set_exception(batch[0][1], exc)
+            return
+
+        for (_, future), record in zip(batch, scored):
+            if not future.done():
+                future.set_result(self._build_result(record))
+
+    async def _score_frame(self, frame: pd.DataFrame, kind: str) -> pd.DataFrame:
+        """Score a dataframe in a worker thread, mapping validation failures.
+
+        Args:
+            frame: Input rows containing identifier and feature columns.
+            kind: Label of the request flow used in log messages.
+
+        Returns:
+            DataFrame with id, probability, and is_default columns.
+
+        Raises:
+            PredictionError: When the payload fails validation.
+        """
+
+        executor = self._executor
+        if executor is not None:
+            chunks = len(frame) // _MIN_PARALLEL_CHUNK_ROWS
+            if chunks > 1:
+                try:
+                    return await self._run_model(
+                        self._score_frame_parallel(frame, chunks), kind
+                    )
+                except BrokenProcessPool:
+                    self._discard_executor(executor)
+        return await self._run_model(asyncio.to_thread(self._model.score, frame), kind)
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        """Stop using a process pool that lost a worker.
+
+        A broken pool rejects every later submission, so batches fall back to
+        in-process scoring instead of failing until the server restarts.
+        """
+
+        if self._executor is not executor:
+            return
+        LOGGER.error("Batch process pool is broken; scoring batches in-process")
+        executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    async def _score_frame_parallel(
+        self, frame: pd.DataFrame, max_chunks: int
+    ) -> pd.DataFrame:
+        """Split a dataframe across the process pool and concatenate the scores.
+
+        Args:
+            frame: Input rows containing identifier and feature columns.
+            max_chunks: Upper bound on the number of slices to submit.
+
+        Returns:
+            DataFrame with id, probability, and is_default columns.
+        """
+
+        loop = asyncio.get_running_loop()
+        n_chunks = min(settings.batch_parallel_workers, max_chunks)
+        bounds = np.linspace(0, len(frame), n_chunks + 1, dtype=int)
+        scored = await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, _score_chunk, frame.iloc[start:stop])
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            )
+        )
+        return pd.concat(scored, ignore_index=True)
+
+    async def _score_records(
+        self, payloads: List[Dict[str, Any]], kind: str
+    ) -> List[Dict[str, Any]]:
+        """Score plain payloads in a worker thread, mapping validation failures.
+
+        Args:
+            payloads: Applicant data provided by the callers.
+            kind: Label of the request flow used in log messages.
+
+        Returns:
+            One dictionary per payload with id, probability, and is_default keys.
+
+        Raises:
+            PredictionError: When a payload fails validation.
+        """
+
+        return await self._run_model(
+            asyncio.to_thread(self._model.score_records, payloads), kind
+        )
+
+    async def _run_model(self, scoring: Awaitable[_T], kind: str) -> _T:
+        """Await a model call, mapping validation failures for the API layer.
+
+        Args:
+            scoring: Pending model call for one request flow.
+            kind: Label of the request flow used in log messages.
+
+        Returns:
+            Result of the model call.
+
+        Raises:
+            PredictionError: When the payload fails validation.
+        """
+
         try:
-            scored = await asyncio.to_thread(self._model.score, frame)
+            return await scoring
         except ModelValidationError as exc:
             raise PredictionError(str(exc)) from exc
-        except ModelError:
-            LOGGER.exception("Model failed to process single payload.")
+        except ModelError as exc:
+            # The controller logs the traceback once when it maps this to a 500.
+            LOGGER.error("Model failed to process %s payload: %s", kind, exc)
             raise
 
-        row = scored.iloc[0]
-        result = {
-            "probability": float(row["probability"]),
-            "is_default": bool(row["is_default"]),
+    def _build_result(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a scored record into the single prediction response payload."""
+
+        identifier = record.get("id")
+        return {
+            "id": str(identifier) if pd.notna(identifier) else None,
+            "probability": float(record["probability"]),
+            "is_default": bool(record["is_default"]),
             "threshold": self.threshold,
         }
-        if "id" in row and pd.notna(row["id"]):
-            result["id"] = str(row["id"])
-        return result
 
     async def predict_batch(self, file_bytes: bytes, filename: str) -> pd.DataFrame:
         """Predict default probabilities for a batch payload.
@@ -86,17 +411,9 @@ class PredictionService:
             raise PredictionError(
                 f"Batch size {len(dataframe)} exceeds limit of {settings.max_batch_rows} rows."
             )
-        try:
-            scored = await asyncio.to_thread(self._model.score, dataframe)
-        except ModelValidationError as exc:
-            raise PredictionError(str(exc)) from exc
-        except ModelError:
-            LOGGER.exception("Model failed to process batch payload.")
-            raise
-        return scored.reset_index(drop=True)
+        return await self._score_frame(dataframe, "batch")
 
-    @staticmethod
-    def _read_input_file(file_bytes: bytes, filename: str) -> pd.DataFrame:
+    def _read_input_file(self, file_bytes: bytes, filename: str) -> pd.DataFrame:
         """Parse CSV or XLS batch files into a pandas DataFrame.
 
         Args:
@@ -107,22 +424,121 @@ class PredictionService:
             DataFrame parsed from the uploaded payload.
 
         Raises:
-            PredictionError: If the file type is not supported.
+            PredictionError: If the file type is not supported or cannot be parsed.
         """
 
         extension = Path(filename).suffix.lower()
         if extension == ".csv":
-            return pd.read_csv(io.BytesIO(file_bytes))
+            return self._read_csv(file_bytes)
         if extension == ".xls":
             return pd.read_excel(io.BytesIO(file_bytes), header=1)
         raise PredictionError("Only CSV and XLS files are supported.")
 
+    def _read_csv(self, file_bytes: bytes) -> pd.DataFrame:
+        """Stream-parse a CSV upload, aborting once it exceeds the row limit.
+
+        Args:
+            file_bytes: Raw bytes of the uploaded file.
+
+        Returns:
+            DataFrame parsed from the uploaded payload.
+
+        Raises:
+            PredictionError: If the file cannot be parsed, repeats a column, or
+                has too many rows.
+        """
+
+        header = _read_csv_header(file_bytes)
+        # Only convert the columns the model reads or rejects, so extra columns
+        # never fail the upload when their inferred type drifts between blocks.
+        wanted = dict.fromkeys(
+            [self._model.id_column, *self._model.expected_columns, "default"]
+        )
+        include_columns = [column for column in wanted if column in header]
+        # pd.read_csv used to rename duplicates to "X.1"; pyarrow keeps them, so
+        # refuse ambiguous copies of the columns that are actually read.
+        duplicates = [column for column in include_columns if header.count(column) > 1]
+        if duplicates:
+            raise PredictionError(f"Duplicate columns: {', '.join(duplicates)}.")
+        # Later blocks reuse the schema inferred from the first one, so pin the
+        # numeric features to float64 (the grouped astype narrows them later),
+        # category codes to int64, and identifiers to text.
+        column_types = {column: pa.float64() for column in self._model.numeric_columns}
+        column_types.update(
+            {column: pa.int64() for column in self._model.category_columns}
+        )
+        column_types[self._model.id_column] = pa.string()
+        column_types["default"] = pa.string()
+        convert_options = pa_csv.ConvertOptions(
+            column_types=column_types,
+            include_columns=include_columns,
+            strings_can_be_null=True,
+        )
+        batches = []
+        total_rows = 0
+        try:
+            reader = pa_csv.open_csv(
+                io.BytesIO(file_bytes),
+                read_options=pa_csv.ReadOptions(block_size=_CSV_BLOCK_SIZE),
+                convert_options=convert_options,
+            )
+            for batch in reader:
+                total_rows += batch.num_rows
+                if total_rows > settings.max_batch_rows:
+                    raise PredictionError(
+                        f"Batch size exceeds limit of {settings.max_batch_rows} rows."
+                    )
+                batches.append(batch)
+        except pa.ArrowInvalid as exc:
+            raise PredictionError(f"Unable to parse CSV file: {exc}") from exc
+        return pa.Table.from_batches(batches, schema=reader.schema).to_pandas()
+
+
+def _read_csv_header(file_bytes: bytes) -> List[str]:
+    """Return the column names on the first line of a CSV upload."""
+
+    first_line = io.BytesIO(file_bytes).readline().rstrip(b"\r\n")
+    try:
+        return next(csv.reader([first_line.decode("utf-8-sig")]), [])
+    except (UnicodeDecodeError, csv.Error) as exc:
+        raise PredictionError(f"Unable to parse CSV file: {exc}") from exc
+
+
+def _load_worker_model() -> None:
+    """Load the estimator once per batch worker process."""
+
+    global _WORKER_MODEL
+    _WORKER_MODEL = CreditDefaultModel()
+    _WORKER_MODEL.warm_up()
+
+
+def _worker_ready() -> None:
+    """No-op task used to force a worker process to start and initialise."""
+
+
+def _score_chunk(frame: pd.DataFrame) -> pd.DataFrame:
+    """Score a dataframe slice with the worker process model."""
+
+    return _WORKER_MODEL.score(frame)
+
+
+def _set_exception(future: asyncio.Future, exc: BaseException) -> None:
+    """Fail a pending future unless its caller already went away."""
+
+    if not future.done():
+        future.set_exception(exc)
+
 
 _SERVICE_INSTANCE: PredictionService | None = None
 
 
-def get_prediction_service() -> PredictionService:
-    """Return a singleton instance of the PredictionService."""
+async def get_prediction_service() -> PredictionService:
+    """Return a singleton instance of the PredictionService.
+
+    Declared as a coroutine so FastAPI resolves the dependency on the event
+    loop instead of dispatching it to the threadpool on every request. The
+    instance is normally created during application startup.
+    """
 
     global _SERVICE_INSTANCE
     if _SERVICE_INSTANCE is None:
@@ -1,12 +1,13 @@
 from .model import CreditDefaultModel, load_model
 from .exceptions import ModelError, ValidationError
-from .config import model_settings
+from .config import get_model_settings, model_settings
 
 __all__ = [
     "CreditDefaultModel",
     "ModelError",
     "ValidationError",
     "model_settings",
+    "get_model_settings",
     "load_model",
 ]
 
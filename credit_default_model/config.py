@@ -1,44 +1,41 @@
-import os
+from functools import lru_cache
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, Field
+from pydantic_settings import BaseSettings
 
 
-def _default_model_dir() -> Path:
-    """Return the default directory that stores model artifacts."""
+class ModelSettings(BaseSettings):
+    """Model artifact configuration.
 
-    override = os.getenv("MODEL_DIR")
-    if override:
-        return Path(override)
-    return Path(__file__).resolve().parents[1] / "models"
-
-
-class ModelSettings(BaseModel):
-    """Model artifact configuration."""
+    Fields are read from ``MODEL_DIR``, ``MODEL_FILENAME``, ``MODEL_SIGNATURE``,
+    ``MODEL_METADATA`` and ``MODEL_ID_COLUMN``.
+    """
 
     base_dir: Path = Field(
         default=Path(__file__).resolve().parents[1],
         description="Repository root directory.",
     )
     model_dir: Path = Field(
-        default_factory=_default_model_dir,
+        default=Path(__file__).resolve().parents[1] / "models",
         description="Directory containing serialized model artifacts.",
     )
     model_filename: str = Field(
-        default=os.getenv("MODEL_FILENAME", "cat_model_v1.0.0.pkl"),
+        default="cat_model_v1.0.0.pkl",
         description="Cloudpickle artifact that stores the trained estimator.",
     )
     input_signature_filename: str = Field(
-        default=os.getenv(
-            "MODEL_SIGNATURE", "cat_model_v1.0.0_input_signature.json"
-        ),
+        default="cat_model_v1.0.0_input_signature.json",
+        validation_alias=AliasChoices("input_signature_filename", "MODEL_SIGNATURE"),
         description="JSON file describing required input schema.",
     )
     metadata_filename: str = Field(
-        default=os.getenv("MODEL_METADATA", "cat_model_v1.0.0_metadata.json"),
+        default="cat_model_v1.0.0_metadata.json",
+        validation_alias=AliasChoices("metadata_filename", "MODEL_METADATA"),
         description="JSON file containing metadata (metrics, threshold).",
     )
     id_column_name: str = Field(
-        default=os.getenv("MODEL_ID_COLUMN", "ID"),
+        default="ID",
+        validation_alias=AliasChoices("id_column_name", "MODEL_ID_COLUMN"),
         description="Identifier column name used in inference payloads.",
     )
 
@@ -61,4 +58,11 @@ class ModelSettings(BaseModel):
         return self.model_dir / self.metadata_filename
 
 
-model_settings = ModelSettings()
+@lru_cache
+def get_model_settings() -> ModelSettings:
+    """Return the model settings, reading the environment only once."""
+
+    return ModelSettings()
+
+
+model_settings = get_model_settings()
@@ -1,15 +1,19 @@
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
 
 import cloudpickle
+import numpy as np
 import pandas as pd
 from .config import ModelSettings, model_settings
 from .exceptions import ModelError, ValidationError
 
 LOGGER = logging.getLogger(__name__)
 
+# Inferred dtypes that support the vectorised ``.str`` accessor.
+_TEXT_DTYPES = frozenset({"string", "mixed", "mixed-integer"})
+
 
 class CreditDefaultModel:
     """Encapsulates artifact loading, validation, and scoring logic."""
@@ -27,6 +31,20 @@ class CreditDefaultModel:
         self._metadata = self._load_json(self._settings.metadata_path)
         self._expected_columns = self._signature.get("expected_columns", [])
         self._dtype_map: Dict[str, str] = self._signature.get("dtypes", {})
+        self._expected_index = pd.Index(self._expected_columns)
+        self._expected_set = frozenset(self._expected_columns)
+        (
+            self._int_cols,
+            self._float_cols,
+            self._cat_cols,
+            self._unsupported_dtypes,
+        ) = self._partition_dtypes()
+        self._numeric_cols = self._int_cols + self._float_cols
+        self._astype_map: Dict[str, Any] = {
+            **{column: "int64" for column in self._int_cols},
+            **{column: "float64" for column in self._float_cols},
+            **{column: "category" for column in self._cat_cols},
+        }
 
         metadata_threshold = self._metadata.get("threshold")
 
@@ -63,6 +81,29 @@ class CreditDefaultModel:
 
         return list(self._expected_columns)
 
+    @property
+    def numeric_columns(self) -> list[str]:
+        """Return the feature names declared as int or float in the signature."""
+
+        return list(self._numeric_cols)
+
+    @property
+    def category_columns(self) -> list[str]:
+        """Return the feature names declared as category in the signature."""
+
+        return list(self._cat_cols)
+
+    def warm_up(self) -> None:
+        """Run one prediction on a synthetic all-zero row.
+
+        The first call into the estimator pays one-off initialisation costs;
+        running it at startup keeps them off the first real request.
+        """
+
+        payload = dict.fromkeys(self._expected_columns, 0)
+        payload.setdefault(self._id_column, 0)
+        self.score_records([payload])
+
     def predict_proba(self, frame: pd.DataFrame) -> pd.Series:
         """Return positive class probabilities for the provided dataframe.
 
@@ -84,20 +125,63 @@ class CreditDefaultModel:
             frame: Input rows containing identifier and feature columns.
 
         Returns:
-            DataFrame with id, probability, and is_default columns.
+            DataFrame with id, probability, and is_default columns and a fresh
+            RangeIndex.
         """
 
         features, identifiers = self._prepare_features(frame)
         probabilities = self._predict_proba(features)
-        result = pd.DataFrame(
+        return pd.DataFrame(
             {
-                "id": identifiers.astype(str),
+                "id": identifiers.to_numpy(),
                 "probability": probabilities,
+                "is_default": probabilities >= self._threshold,
             },
-            index=features.index,
+            copy=False,
         )
-        result["is_default"] = result["probability"] >= self._threshold
-        return result
+
+    def validate_record(self, record: Mapping[str, Any]) -> None:
+        """Check the identifier and reserved keys of a single payload.
+
+        Args:
+            record: Payload keyed by identifier and feature names.
+
+        Raises:
+            ValidationError: If the identifier is missing or the target is present.
+        """
+
+        if self._id_column not in record:
+            raise ValidationError(f"Missing identifier column: {self._id_column}.")
+        if record[self._id_column] is None:
+            raise ValidationError("Identifier column contains missing values.")
+        if "default" in record:
+            raise ValidationError("Column 'default' is not allowed in inference payloads.")
+
+    def score_records(self, records: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """Score plain mappings through the same preparation as batch frames.
+
+        Args:
+            records: Payloads keyed by identifier and feature names.
+
+        Returns:
+            One dictionary per record with id, probability, and is_default keys.
+
+        Raises:
+            ValidationError: If a record does not satisfy schema requirements.
+        """
+
+        for record in records:
+            self.validate_record(record)
+        features, identifiers = self._prepare_features(pd.DataFrame.from_records(records))
+        probabilities = self._predict_proba(features)
+        return [
+            {
+                "id": str(identifier),
+                "probability": float(probability),
+                "is_default": bool(probability >= self._threshold),
+            }
+            for identifier, probability in zip(identifiers, probabilities)
+        ]
 
     def _prepare_features(self, frame: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
         """Validate and coerce the payload before scoring.
@@ -119,62 +203,97 @@ class CreditDefaultModel:
                 "Column 'default' is not allowed in inference payloads."
             )
 
-        missing = [col for col in self._expected_columns if col not in frame.columns]
-        if missing:
+        present = set(frame.columns)
+        if not self._expected_set.issubset(present):
+            missing = [col for col in self._expected_columns if col not in present]
             raise ValidationError(f"Missing columns: {', '.join(missing)}.")
 
         extra = [
             col
             for col in frame.columns
-            if col not in self._expected_columns and col != self._id_column
+            if col not in self._expected_set and col != self._id_column
         ]
         if extra:
             LOGGER.debug("Ignoring extra columns: %s", ", ".join(extra))
 
-        features = frame[self._expected_columns].copy()
-        features = features.replace(r"^\s*$", pd.NA, regex=True)
-        for column, dtype in self._dtype_map.items():
-            if column not in features.columns:
-                continue
-            if dtype.startswith("int"):
-                features[column] = pd.to_numeric(
-                    features[column], errors="raise"
-                ).astype("int64")
-            elif dtype.startswith("float"):
-                features[column] = pd.to_numeric(
-                    features[column], errors="raise"
-                ).astype("float64")
-            elif dtype == "category":
-                features[column] = features[column].astype("category")
-            else:
-                raise ValidationError(
-                    f"Unsupported dtype '{dtype}' for column '{column}'."
+        if self._unsupported_dtypes:
+            column, dtype = next(iter(self._unsupported_dtypes.items()))
+            raise ValidationError(f"Unsupported dtype '{dtype}' for column '{column}'.")
+
+        features = frame.reindex(columns=self._expected_index)
+        object_cols = features.columns[features.dtypes == object]
+        if len(object_cols):
+            for column in object_cols:
+                values = features[column]
+                if pd.api.types.infer_dtype(values, skipna=True) not in _TEXT_DTYPES:
+                    continue
+                blank = values.str.strip() == ""
+                if blank.any():
+                    features[column] = values.mask(blank)
+            numeric_objects = object_cols.intersection(self._numeric_cols)
+            if len(numeric_objects):
+                features[numeric_objects] = features[numeric_objects].apply(
+                    pd.to_numeric, errors="raise"
                 )
 
-        if features.isnull().any(axis=1).any():
+        if features.isnull().to_numpy().any():
             raise ValidationError("Input payload contains missing values.")
+        if self._numeric_cols and np.isinf(
+            features[self._numeric_cols].to_numpy(dtype=np.float64)
+        ).any():
+            raise ValidationError("Input payload contains infinite values.")
+        try:
+            features = features.astype(self._astype_map, copy=False)
+        except (TypeError, ValueError) as exc:
+            raise ValidationError(f"Invalid feature value: {exc}.") from None
 
         identifiers = frame[self._id_column]
         if identifiers.isnull().any():
             raise ValidationError("Identifier column contains missing values.")
 
-        return features, identifiers.astype(str)
+        # Identifiers keep their parsed dtype; CSV serialization stringifies them.
+        return features, identifiers
+
+    def _partition_dtypes(
+        self,
+    ) -> Tuple[List[str], List[str], List[str], Dict[str, str]]:
+        """Group expected columns by the dtype declared in the signature.
+
+        Returns:
+            Tuple of (int columns, float columns, category columns, unsupported
+            column-to-dtype mapping).
+        """
+
+        int_cols, float_cols, cat_cols = [], [], []
+        unsupported: Dict[str, str] = {}
+        for column in self._expected_columns:
+            dtype = self._dtype_map.get(column)
+            if dtype is None:
+                continue
+            if dtype.startswith("int"):
+                int_cols.append(column)
+            elif dtype.startswith("float"):
+                float_cols.append(column)
+            elif dtype == "category":
+                cat_cols.append(column)
+            else:
+                unsupported[column] = dtype
+        return int_cols, float_cols, cat_cols, unsupported
 
-    def _predict_proba(self, features: pd.DataFrame) -> pd.Series:
+    def _predict_proba(self, features: pd.DataFrame) -> np.ndarray:
         """Predict positive class probabilities from prepared features.
 
         Args:
             features: Prepared feature matrix.
 
         Returns:
-            Series with positive-class probabilities.
+            Array with positive-class probabilities in row order.
 
         Raises:
             ModelError: If the estimator does not expose binary probabilities.
         """
 
-        probabilities = self._estimator.predict_proba(features)
-        return pd.Series(probabilities[:, 1], index=features.index, name="probability")
+        return self._estimator.predict_proba(features)[:, 1]
 
     @staticmethod
     def _load_estimator(path: Path):
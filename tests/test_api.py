@@ -1,6 +1,12 @@
+import asyncio
 import io
+from concurrent.futures.process import BrokenProcessPool
+import pandas as pd
 from fastapi.testclient import TestClient
+from app.core import settings
 from app.main import app
+from app.services import PredictionService, get_prediction_service, prediction_service
+from credit_default_model import CreditDefaultModel
 
 client = TestClient(app)
 
@@ -36,6 +42,17 @@ def build_payload() -> dict[str, int | float]:
     }
 
 
+def build_batch_file(rows: list[dict[str, int | float | str]]) -> dict:
+    """Return a multipart file payload holding the rows as CSV."""
+
+    headers = list(rows[0].keys())
+    csv_lines = [",".join(headers)]
+    for row in rows:
+        csv_lines.append(",".join(str(row[col]) for col in headers))
+    csv_bytes = "\n".join(csv_lines).encode("utf-8")
+    return {"file": ("batch.csv", io.BytesIO(csv_bytes), "text/csv")}
+
+
 def test_single_prediction_happy_path() -> None:
     """Ensure the single prediction endpoint returns a probability."""
 
@@ -72,3 +89,253 @@ def test_batch_prediction_happy_path() -> None:
     assert "probability" in body
     assert "is_default" in body
     assert "id" in body
+
+
+def clear_prediction_cache() -> None:
+    """Drop cached single predictions so the next request reaches the model."""
+
+    asyncio.run(get_prediction_service())._cache.clear()
+
+
+def test_single_prediction_micro_batched(monkeypatch) -> None:
+    """Ensure single predictions resolve through the micro-batching queue."""
+
+    batches: list[int] = []
+    score_micro_batch = PredictionService._score_micro_batch
+
+    async def counting_score_micro_batch(self, batch):
+        batches.append(len(batch))
+        await score_micro_batch(self, batch)
+
+    monkeypatch.setattr(
+        PredictionService, "_score_micro_batch", counting_score_micro_batch
+    )
+    with TestClient(app) as batching_client:
+        clear_prediction_cache()
+        response = batching_client.post("/api/v1/predictions", json=build_payload())
+    assert response.status_code == 200
+    assert response.json()["id"] == "1001"
+    assert batches == [1]
+
+
+def test_single_prediction_cache_hit_skips_model(monkeypatch) -> None:
+    """Ensure repeated features are answered from the cache with the new ID."""
+
+    calls: list[int] = []
+    score_records = CreditDefaultModel.score_records
+
+    def counting_score_records(self, records):
+        calls.append(len(records))
+        return score_records(self, records)
+
+    monkeypatch.setattr(CreditDefaultModel, "score_records", counting_score_records)
+    clear_prediction_cache()
+    first = client.post("/api/v1/predictions", json=build_payload()).json()
+    second = client.post(
+        "/api/v1/predictions", json={**build_payload(), "ID": 2002}
+    ).json()
+    assert calls == [1]
+    assert second["id"] == "2002"
+    assert second["probability"] == first["probability"]
+    assert second["is_default"] == first["is_default"]
+
+
+def test_single_prediction_unserializable_payload_skips_cache() -> None:
+    """Ensure integers orjson cannot encode bypass the cache instead of failing."""
+
+    service = asyncio.run(get_prediction_service())
+    assert service._cache_key({**build_payload(), "SEX": 10**30}) is None
+
+
+def test_invalid_single_prediction_rejected_before_queue(monkeypatch) -> None:
+    """Ensure payloads without an ID never reach the micro-batch worker."""
+
+    batches: list[int] = []
+    score_micro_batch = PredictionService._score_micro_batch
+
+    async def counting_score_micro_batch(self, batch):
+        batches.append(len(batch))
+        await score_micro_batch(self, batch)
+
+    monkeypatch.setattr(
+        PredictionService, "_score_micro_batch", counting_score_micro_batch
+    )
+    with TestClient(app) as batching_client:
+        response = batching_client.post(
+            "/api/v1/predictions", json={**build_payload(), "ID": None}
+        )
+    assert response.status_code == 422
+    assert batches == []
+
+
+def test_invalid_payload_does_not_fail_its_micro_batch(monkeypatch) -> None:
+    """Ensure a bad payload only fails its own request within a shared window."""
+
+    monkeypatch.setattr(settings, "micro_batch_wait_ms", 200.0)
+    batches: list[int] = []
+    score_micro_batch = PredictionService._score_micro_batch
+
+    async def counting_score_micro_batch(self, batch):
+        batches.append(len(batch))
+        await score_micro_batch(self, batch)
+
+    monkeypatch.setattr(
+        PredictionService, "_score_micro_batch", counting_score_micro_batch
+    )
+
+    async def score_window() -> list:
+        service = PredictionService()
+        await service.start()
+        try:
+            return await asyncio.gather(
+                service.predict_single(build_payload()),
+                service.predict_single(
+                    {**build_payload(), "ID": 1002, "LIMIT_BAL": float("inf")}
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            await service.stop()
+
+    valid, invalid = asyncio.run(score_window())
+    assert batches[0] == 2
+    assert valid["id"] == "1001"
+    assert isinstance(invalid, prediction_service.PredictionError)
+    assert str(invalid) == "Input payload contains infinite values."
+
+
+def test_batch_upload_over_size_limit_rejected(monkeypatch) -> None:
+    """Ensure uploads above the byte limit are refused before parsing."""
+
+    monkeypatch.setattr(settings, "max_upload_bytes", 10)
+    response = client.post(
+        "/api/v1/predictions/batch", files=build_batch_file([build_payload()])
+    )
+    assert response.status_code == 413
+
+
+def test_batch_over_row_limit_rejected_while_streaming(monkeypatch) -> None:
+    """Ensure CSV parsing stops as soon as the row limit is exceeded."""
+
+    monkeypatch.setattr(settings, "max_batch_rows", 1)
+    rows = [build_payload(), {**build_payload(), "ID": 1002}]
+    response = client.post("/api/v1/predictions/batch", files=build_batch_file(rows))
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Batch size exceeds limit of 1 rows."
+
+
+def test_batch_csv_types_stable_across_blocks(monkeypatch) -> None:
+    """Ensure a fractional amount after integer-only blocks still parses."""
+
+    monkeypatch.setattr(prediction_service, "_CSV_BLOCK_SIZE", 512)
+    rows = [{**build_payload(), "ID": 2000 + index} for index in range(30)]
+    rows.append({**build_payload(), "ID": 3000, "BILL_AMT1": 1234.5})
+    response = client.post("/api/v1/predictions/batch", files=build_batch_file(rows))
+    assert response.status_code == 200
+    lines = response.content.decode("utf-8").strip().splitlines()
+    assert len(lines) == len(rows) + 1
+    assert lines[-1].startswith("3000,")
+
+
+def test_batch_extra_column_type_drift_ignored(monkeypatch) -> None:
+    """Ensure extra columns whose type changes in later blocks are not parsed."""
+
+    monkeypatch.setattr(prediction_service, "_CSV_BLOCK_SIZE", 512)
+    rows = [
+        {**build_payload(), "ID": 2000 + index, "NOTE": "", "REF": index}
+        for index in range(30)
+    ]
+    rows.append({**build_payload(), "ID": 3000, "NOTE": "late text", "REF": "x9"})
+    response = client.post("/api/v1/predictions/batch", files=build_batch_file(rows))
+    assert response.status_code == 200
+    lines = response.content.decode("utf-8").strip().splitlines()
+    assert len(lines) == len(rows) + 1
+    assert lines[-1].startswith("3000,")
+
+
+def test_parallel_batch_scoring_matches_serial(monkeypatch) -> None:
+    """Ensure the process-pool batch path returns the serial scores."""
+
+    monkeypatch.setattr(settings, "batch_parallel_workers", 2)
+    frame = pd.DataFrame(
+        [{**build_payload(), "ID": 4000 + index, "PAY_0": index % 4} for index in range(10)]
+    )
+
+    async def score_both() -> tuple[pd.DataFrame, pd.DataFrame]:
+        service = PredictionService()
+        await service.start()
+        try:
+            parallel = await service._score_frame_parallel(frame, 2)
+            serial = await asyncio.to_thread(service._model.score, frame)
+        finally:
+            await service.stop()
+        return parallel, serial
+
+    parallel, serial = asyncio.run(score_both())
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+def test_broken_process_pool_falls_back_to_serial(monkeypatch) -> None:
+    """Ensure batches still score in-process once a worker process has died."""
+
+    monkeypatch.setattr(prediction_service, "_MIN_PARALLEL_CHUNK_ROWS", 1)
+    frame = pd.DataFrame(
+        [{**build_payload(), "ID": 5000 + index} for index in range(3)]
+    )
+    attempts: list[int] = []
+
+    class BrokenExecutor:
+        def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+            pass
+
+    async def broken_parallel(self, frame, max_chunks):
+        attempts.append(len(frame))
+        raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(PredictionService, "_score_frame_parallel", broken_parallel)
+
+    async def score_twice() -> list[pd.DataFrame]:
+        service = PredictionService()
+        service._executor = BrokenExecutor()
+        scored = [await service._score_frame(frame, "batch") for _ in range(2)]
+        assert service._executor is None
+        return scored
+
+    first, second = asyncio.run(score_twice())
+    assert attempts == [3]
+    assert first["id"].tolist() == [5000, 5001, 5002]
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_batch_malformed_csv_rejected() -> None:
+    """Ensure CSV files that pyarrow cannot parse return a 422."""
+
+    file = {"file": ("batch.csv", io.BytesIO(b"ID,LIMIT_BAL\n1,2,3\n"), "text/csv")}
+    response = client.post("/api/v1/predictions/batch", files=file)
+    assert response.status_code == 422
+    assert response.json()["detail"].startswith("Unable to parse CSV file")
+
+
+def test_batch_duplicate_headers_rejected() -> None:
+    """Ensure repeated CSV header names return a 422 instead of a 500."""
+
+    payload = build_payload()
+    header = ",".join([*payload, "LIMIT_BAL"])
+    row = ",".join(str(value) for value in [*payload.values(), payload["LIMIT_BAL"]])
+    file = {"file": ("batch.csv", io.BytesIO(f"{header}\n{row}".encode()), "text/csv")}
+    response = client.post("/api/v1/predictions/batch", files=file)
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Duplicate columns: LIMIT_BAL."
+
+
+def test_batch_duplicate_ignored_headers_accepted() -> None:
+    """Ensure repeated names among ignored columns, e.g. blanks, still parse."""
+
+    rows = [build_payload(), {**build_payload(), "ID": 1002}]
+    file = build_batch_file(rows)
+    name, buffer, content_type = file["file"]
+    csv_text = buffer.getvalue().decode("utf-8").replace("\n", ",,\n") + ",,"
+    file = {"file": (name, io.BytesIO(csv_text.encode("utf-8")), content_type)}
+    response = client.post("/api/v1/predictions/batch", files=file)
+    assert response.status_code == 200
+    assert len(response.content.decode("utf-8").strip().splitlines()) == 3
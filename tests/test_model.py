@@ -0,0 +1,101 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from credit_default_model import CreditDefaultModel, ValidationError
+from credit_default_model.config import ModelSettings
+
+FEATURES = [
+    "ID",
+    "LIMIT_BAL",
+    "SEX",
+    "EDUCATION",
+    "MARRIAGE",
+    "AGE",
+    *[f"PAY_{month}" for month in (0, 2, 3, 4, 5, 6)],
+    *[f"BILL_AMT{month}" for month in range(1, 7)],
+    *[f"PAY_AMT{month}" for month in range(1, 7)],
+]
+CATEGORY_FEATURES = ("SEX", "EDUCATION", "MARRIAGE")
+
+
+class RecordingEstimator:
+    """Estimator stub that records the frames it is asked to score."""
+
+    def __init__(self) -> None:
+        self.frames: list[pd.DataFrame] = []
+
+    def predict_proba(self, features: pd.DataFrame) -> np.ndarray:
+        self.frames.append(features)
+        positive = np.full(len(features), 0.25)
+        return np.column_stack([1 - positive, positive])
+
+
+@pytest.fixture
+def model(tmp_path, monkeypatch) -> CreditDefaultModel:
+    """Return a model built from a signature with the notebook's dtypes."""
+
+    signature = {
+        "id_name": "ID",
+        "expected_columns": FEATURES,
+        "dtypes": {
+            column: "category" if column in CATEGORY_FEATURES else "int64"
+            for column in FEATURES
+        },
+    }
+    (tmp_path / "signature.json").write_text(json.dumps(signature))
+    (tmp_path / "metadata.json").write_text(json.dumps({"threshold": 0.2}))
+    (tmp_path / "model.pkl").touch()
+    estimator = RecordingEstimator()
+    monkeypatch.setattr(
+        CreditDefaultModel, "_load_estimator", staticmethod(lambda path: estimator)
+    )
+    settings = ModelSettings(
+        model_dir=tmp_path,
+        model_filename="model.pkl",
+        input_signature_filename="signature.json",
+        metadata_filename="metadata.json",
+    )
+    return CreditDefaultModel(settings=settings)
+
+
+def build_record(identifier: int) -> dict[str, int]:
+    """Return a payload with every expected feature set."""
+
+    return {**dict.fromkeys(FEATURES, 1), "ID": identifier}
+
+
+def test_score_records_keeps_category_features(model: CreditDefaultModel) -> None:
+    """Ensure category signatures score records in one estimator call."""
+
+    scored = model.score_records([build_record(1), build_record(2)])
+
+    assert [record["id"] for record in scored] == ["1", "2"]
+    assert all(record["is_default"] for record in scored)
+    (features,) = model._estimator.frames
+    assert list(features.columns) == FEATURES
+    for column in CATEGORY_FEATURES:
+        assert isinstance(features[column].dtype, pd.CategoricalDtype)
+
+
+def test_score_records_rejects_infinite_values(model: CreditDefaultModel) -> None:
+    """Ensure infinite amounts fail validation instead of the int64 cast."""
+
+    record = {**build_record(1), "LIMIT_BAL": float("inf")}
+    with pytest.raises(ValidationError, match="infinite values"):
+        model.score_records([record])
+
+
+def test_score_records_matches_batch_dtypes(model: CreditDefaultModel) -> None:
+    """Ensure single and batch paths hand the estimator identical features."""
+
+    record = {**build_record(7), "LIMIT_BAL": 2**24 + 1}
+    model.score_records([record])
+    model.score(pd.DataFrame([record]))
+
+    single, batch = model._estimator.frames
+    assert single["LIMIT_BAL"].iloc[0] == 2**24 + 1
+    pd.testing.assert_series_equal(single.dtypes, batch.dtypes)
+    pd.testing.assert_frame_equal(
+        single.astype(str), batch.reset_index(drop=True).astype(str)
+    )